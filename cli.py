@@ -222,14 +222,14 @@ class Shell(cmd.Cmd):
         t = float(args[1]) * 1000
         if id in self.gdat_channels:
             ch = self.gdat_channels[id]
-            i = np.searchsorted(ch['points'][:,0], t)
+            i = np.searchsorted(ch['t_raw'], t)
 
             print(f"{ch['name']} ({ch['unit']})")
             print(f'points near t = {t}ms ...')
             if i > 0:
-                print(f"t = {ch['points'][i-1][0]}ms, v = {ch['points'][i-1][1]}")
+                print(f"t = {ch['t_raw'][i-1]}ms, v = {ch['v_raw'][i-1]}")
             if i < ch['n_points']:
-                print(f"t = {ch['points'][i][0]}ms, v = {ch['points'][i][1]}") 
+                print(f"t = {ch['t_raw'][i]}ms, v = {ch['v_raw'][i]}") 
         else:
             console.print(f'ERROR: {id} is not a gdat channel', style='red')
 
@@ -265,7 +265,7 @@ class Shell(cmd.Cmd):
         start = time.time()
         print(f'loading {path} ...')
 
-        (sof, ext, data) = path.read_bytes().partition(b'.gdat:')
+        (sof, data) = gdat.read(path)
         print(f'read {len(data)} bytes of data')
         self.gdat_t0 = gdat.get_t0(sof)
         self.gdat_channels = gdat.parse(data, self.config_params)
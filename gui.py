@@ -114,7 +114,7 @@ def convert():
         try:
             print(f'converting: {path} ...')
             # parse .gdat
-            (sof, ext, data) = path.read_bytes().partition(b'.gdat:')
+            (sof, data) = gdat.read(path)
             print(f'read {len(data)} bytes of data')
             t0 = gdat.get_t0(sof)
             channels = gdat.parse(data, parameters)
@@ -1,4 +1,5 @@
 from pathlib import Path
+import struct
 import yaml
 import urllib.request
 
@@ -37,7 +38,9 @@ def get_params(config: dict):
             'name': v.get('motec_name', ''),
             'unit': v.get('unit', ''),
             'type': type,
-            **TYPES[type]
+            **TYPES[type],
+            # compiled once here so format strings aren't re-parsed for every packet
+            'struct': struct.Struct(TYPES[type]['format'])
         }
     print(f'found {len(parameters)} parameters')
     return parameters
@@ -2,9 +2,19 @@ import time
 import struct
 import numpy as np
 import math
-from fractions import Fraction
+from collections import defaultdict
 import matplotlib.pyplot as plt
 
+# numba is optional, without it packets are decoded with _decode_packets_py
+try:
+    from numba import njit, prange, get_num_threads
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        return lambda f: f
+    prange = range
+
 # .gdat files begin with "/PLM_YYYY-MM-DD-HH-MM-SS.gdat:" (RTC time of file creation)
 # followed by a series of packets of the following format (big endian):
 # 0    1 2 3 4     5 6   7 n    n+1
@@ -17,6 +27,30 @@ import matplotlib.pyplot as plt
 START = 0x7E
 ESC = 0x7D
 ESC_XOR = 0x20
+START_BYTE = bytes((START,))
+ESC_BYTE = bytes((ESC,))
+
+# packet header (TIMESTAMP, ID)
+_HDR = struct.Struct('>IH')
+
+# unescaped packet lengths, excluding the start delimiter
+# TIMESTAMP (4) + ID (2) + DATA (1-8) + CHECKSUM (1)
+MIN_PACKET_LENGTH = 8
+MAX_PACKET_LENGTH = 15
+
+# max length of the "/PLM_YYYY-MM-DD-HH-MM-SS.gdat:" start of file string
+SOF_MAX_LENGTH = 256
+
+# minimum bytes per chunk when decoding in parallel
+CHUNK_SIZE = 1 << 20
+
+# SWAR constants for scanning 8 bytes at a time as a uint64
+_ONES = np.uint64(0x0101010101010101)
+_HIGHS = np.uint64(0x8080808080808080)
+_START_WORD = np.uint64(0x7E7E7E7E7E7E7E7E)
+_ESC_WORD = np.uint64(0x7D7D7D7D7D7D7D7D)
+_LOW_BYTES = np.uint64(0x00FF00FF00FF00FF)
+_ONES_16 = np.uint64(0x0001000100010001)
 
 def get_t0(sof):
     try:
@@ -28,6 +62,309 @@ def get_t0(sof):
             print(f'WARNING: failed to parse timestamp "{sof.decode()}"')
             return time.gmtime(0)
 
+# memory map a .gdat file instead of copying it into memory
+# returns the start of file string (see get_t0) and a read-only uint8 array of packet data
+def read(path):
+    if path.stat().st_size == 0:
+        return (b'', np.empty(0, dtype=np.uint8))
+    mm = np.memmap(path, dtype=np.uint8, mode='r')
+    (sof, ext, _) = mm[:SOF_MAX_LENGTH].tobytes().partition(b'.gdat:')
+    if not ext:
+        # no start of file string, there's no data to parse
+        return (sof, mm[len(mm):])
+    return (sof, mm[len(sof) + len(ext):])
+
+# remove escape bytes from a packet
+# most packets contain no ESC and are returned as-is
+# otherwise the byte following each ESC (or run of ESCs) is XORed with ESC_XOR
+def unescape(packet):
+    if ESC not in packet:
+        return packet
+    parts = packet.split(ESC_BYTE)
+    pkt = bytearray(parts[0])
+    for part in parts[1:]:
+        if part:
+            pkt.append(part[0] ^ ESC_XOR)
+            pkt += part[1:]
+    return pkt
+
+# validate the checksum of an unescaped packet (excluding the start delimiter)
+def checksum(pkt):
+    return (sum(pkt, START) - pkt[-1]) & 0xFF == pkt[-1]
+
+# load 8 bytes starting at buf[i] as a little endian uint64
+# LLVM combines this into a single unaligned load
+@njit(cache=True)
+def _load_u64(buf, i):
+    w = np.uint64(0)
+    for j in range(8):
+        w |= np.uint64(buf[i + j]) << np.uint64(8 * j)
+    return w
+
+# check if any byte in w is START or ESC
+# a byte of w ^ word is zero where w matches, (v - 0x01..) & ~v & 0x80.. is nonzero if v has a zero byte
+@njit(cache=True)
+def _has_delimiter(w):
+    s = w ^ _START_WORD
+    e = w ^ _ESC_WORD
+    return ((((s - _ONES) & ~s) | ((e - _ONES) & ~e)) & _HIGHS) != np.uint64(0)
+
+# sum the 8 bytes of w
+# add neighboring bytes into 16-bit lanes, then the multiply accumulates all lanes into the top lane
+@njit(cache=True)
+def _sum_bytes(w):
+    s = (w & _LOW_BYTES) + ((w >> np.uint64(8)) & _LOW_BYTES)
+    return np.int64((s * _ONES_16) >> np.uint64(48))
+
+# frame, unescape, and validate packets in a .gdat buffer
+# buf is split on START just like bytes.split(), so data before the first START is treated as a packet
+# sizes maps each id to its data size (0 = unknown id)
+# valid packets are written to the out_ arrays, payloads are packed back-to-back in out_data
+# returns (number of valid packets, number of errors, bytes written to out_data)
+@njit(cache=True)
+def _decode_packets_nb(buf, sizes, out_ts, out_id, out_off, out_data):
+    n = 0
+    n_errors = 0
+    n_data = 0
+    pkt = np.empty(MAX_PACKET_LENGTH, np.uint8)
+    pkt_len = 0
+    checksum = START
+    esc = False
+    i = 0
+    end = len(buf)
+    slow_end = 0 # bytes before this index are scanned one at a time
+    while i <= end:
+        # most bytes are neither START nor ESC, skip over them 8 at a time
+        if not esc and i >= slow_end and i + 8 <= end:
+            w = _load_u64(buf, i)
+            if not _has_delimiter(w):
+                if pkt_len + 8 <= MAX_PACKET_LENGTH:
+                    for j in range(8):
+                        pkt[pkt_len + j] = buf[i + j]
+                pkt_len += 8
+                checksum += _sum_bytes(w)
+                i += 8
+                continue
+            # a delimiter is somewhere in these 8 bytes
+            slow_end = i + 8
+        if i == end or buf[i] == START:
+            # end of packet, validate length, id, and checksum
+            valid = False
+            pid = 0
+            size = 0
+            if MIN_PACKET_LENGTH <= pkt_len <= MAX_PACKET_LENGTH:
+                pid = (np.int64(pkt[4]) << 8) | np.int64(pkt[5])
+                size = sizes[pid]
+                last = np.int64(pkt[pkt_len-1])
+                if size > 0 and pkt_len == 7 + size and ((checksum - last) & 0xFF) == last:
+                    valid = True
+            if valid:
+                out_ts[n] = (np.int64(pkt[0]) << 24) | (np.int64(pkt[1]) << 16) | (np.int64(pkt[2]) << 8) | np.int64(pkt[3])
+                out_id[n] = pid
+                out_off[n] = n_data
+                for j in range(size):
+                    out_data[n_data + j] = pkt[6 + j]
+                n_data += size
+                n += 1
+            else:
+                n_errors += 1
+            # start a new packet
+            pkt_len = 0
+            checksum = START
+            esc = False
+        else:
+            b = np.int64(buf[i])
+            if b == ESC:
+                esc = True
+            else:
+                if esc:
+                    b ^= ESC_XOR
+                    esc = False
+                # bytes past MAX_PACKET_LENGTH are counted but not stored, packet will be invalid
+                if pkt_len < MAX_PACKET_LENGTH:
+                    pkt[pkt_len] = b
+                pkt_len += 1
+                checksum += b
+        i += 1
+    return n, n_errors, n_data
+
+# find up to n_chunks-1 START bytes at or after evenly spaced positions in buf
+# escaped data never contains START, so packets can be framed independently on either side of a split
+@njit(cache=True)
+def _find_splits(buf, n_chunks):
+    splits = np.empty(n_chunks - 1, np.int64)
+    n = 0
+    i = 0
+    for c in range(1, n_chunks):
+        i = max(i, len(buf) * c // n_chunks)
+        while i < len(buf) and buf[i] != START:
+            i += 1
+        if i == len(buf):
+            break
+        splits[n] = i
+        n += 1
+        i += 1
+    return splits[:n]
+
+# run _decode_packets_nb on each chunk buf[lo[c]:hi[c]] in parallel
+# chunk c writes packets to out_ slots base[c]:base[c+1] and data to out_data[lo[c]:hi[c]]
+# offsets are converted to be relative to the start of buf
+@njit(parallel=True, cache=True)
+def _decode_chunks_nb(buf, lo, hi, base, sizes, out_ts, out_id, out_off, out_data, n_valid, n_errors):
+    for c in prange(len(lo)):
+        b = base[c]
+        e = base[c+1]
+        n, n_err, _ = _decode_packets_nb(buf[lo[c]:hi[c]], sizes, out_ts[b:e], out_id[b:e], out_off[b:e], out_data[lo[c]:hi[c]])
+        for k in range(b, b + n):
+            out_off[k] += lo[c]
+        n_valid[c] = n
+        n_errors[c] = n_err
+
+# bucket packets by id with a counting sort, keeping file order within each id
+# starts/byte_starts give the first slot/data byte of each id in the output
+# returns timestamps and data grouped by id
+@njit(cache=True)
+def _bucket_by_id_nb(ids, ts, offsets, payload, sizes, starts, byte_starts):
+    pos = starts.copy()
+    byte_pos = byte_starts.copy()
+    out_ts = np.empty(len(ids), np.uint32)
+    out_data = np.empty(byte_starts[-1], np.uint8)
+    for k in range(len(ids)):
+        i = ids[k]
+        out_ts[pos[i]] = ts[k]
+        pos[i] += 1
+        for j in range(sizes[i]):
+            out_data[byte_pos[i] + j] = payload[offsets[k] + j]
+        byte_pos[i] += sizes[i]
+    return out_ts, out_data
+
+# pure Python equivalent of decode_packets, used when numba isn't installed
+def _decode_packets_py(data, parameters):
+    ts = {}
+    values = {}
+    n_errors = 0
+    for packet in bytes(data).split(START_BYTE):
+        pkt = unescape(packet)
+        # unpack components
+        try:
+            t, id = _HDR.unpack_from(pkt)
+            value = parameters[id]['struct'].unpack(pkt[6:-1])[0]
+        except:
+            n_errors += 1
+            continue
+        if not checksum(pkt):
+            n_errors += 1
+            continue
+        if id not in ts:
+            ts[id] = []
+            values[id] = []
+        ts[id].append(t)
+        values[id].append(value)
+    points = {
+        id: (np.array(ts[id], dtype=np.uint32), np.array(values[id], dtype=np.dtype(parameters[id]['format'])))
+        for id in ts
+    }
+    return points, n_errors
+
+# decode packets from a byte string
+# returns {id: (timestamps, values)} for each id with valid packets, and an error count
+# values are in the parameter's native dtype
+def decode_packets(data, parameters):
+    if not HAVE_NUMBA:
+        return _decode_packets_py(data, parameters)
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    sizes = np.zeros(0x10000, dtype=np.int64)
+    for (id, param) in parameters.items():
+        if 0 <= id < len(sizes):
+            sizes[id] = param['size']
+
+    # split large buffers into chunks at START bytes, one per thread
+    # chunks are buf[0:split0], buf[split0+1:split1], ..., buf[splitN+1:]
+    n_chunks = max(1, min(get_num_threads(), len(buf) // CHUNK_SIZE))
+    splits = _find_splits(buf, n_chunks)
+    lo = np.concatenate(([0], splits + 1))
+    hi = np.append(splits, len(buf))
+
+    # every valid packet after the first in a chunk is preceded by a START
+    base = np.zeros(len(lo) + 1, dtype=np.int64)
+    base[1:] = np.cumsum((hi - lo) // (MIN_PACKET_LENGTH + 1) + 1)
+    ts = np.empty(base[-1], dtype=np.uint32)
+    ids = np.empty(base[-1], dtype=np.uint16)
+    offsets = np.empty(base[-1], dtype=np.int64)
+    payload = np.empty(len(buf), dtype=np.uint8)
+    n_valid = np.empty(len(lo), dtype=np.int64)
+    n_errors = np.empty(len(lo), dtype=np.int64)
+
+    _decode_chunks_nb(buf, lo, hi, base, sizes, ts, ids, offsets, payload, n_valid, n_errors)
+
+    # collect the filled slots of each chunk
+    keep = np.concatenate([np.arange(b, b + n) for (b, n) in zip(base[:-1], n_valid)])
+    ts, ids, offsets = ts[keep], ids[keep], offsets[keep]
+    n_errors = int(n_errors.sum())
+
+    # group packets by id, every packet in a group has the same data format
+    # so each group's data is contiguous and can be reinterpreted in one step
+    counts = np.bincount(ids, minlength=len(sizes))
+    starts = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(counts, out=starts[1:])
+    byte_starts = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(counts * sizes, out=byte_starts[1:])
+    ts, data = _bucket_by_id_nb(ids, ts, offsets, payload, sizes, starts, byte_starts)
+
+    points = {}
+    for id in np.flatnonzero(counts).tolist():
+        values = data[byte_starts[id]:byte_starts[id+1]].view(np.dtype(parameters[id]['format']))
+        points[id] = (ts[starts[id]:starts[id+1]], values)
+    return points, n_errors
+
+# find the fraction closest to x with a denominator <= max_denom
+# same result as Fraction(x).limit_denominator(max_denom), but using only integer math
+# walks the continued fraction of x, then picks the closer of the last convergent and semiconvergent
+def best_ratio(x, max_denom):
+    n, d = float(x).as_integer_ratio()
+    if d <= max_denom:
+        return (n, d)
+    x_denom = d
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    while True:
+        a = n // d
+        q2 = q0 + a*q1
+        if q2 > max_denom:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a*p1, q2
+        n, d = d, n - a*d
+    k = (max_denom - q0) // q1
+    # p1/q1 is d/(q1*x_denom) from x, the semiconvergent is 1/(q1*(q0+k*q1)) from p1/q1
+    if 2*d*(q0 + k*q1) <= x_denom:
+        return (p1, q1)
+    return (p0 + k*p1, q0 + k*q1)
+
+# find shift, scalar, and divisor to fit values up to abs_max in a s32
+# encoded_value = value / 10^-shift / scalar * divisor
+# returns None if the scalar doesn't fit in 12 bits
+def get_scalars(abs_max):
+    if abs_max == 0:
+        return (9, 1, 1)
+    # find the closest value of 8*10^x to abs_max
+    x = math.floor(math.log10(abs_max / 8))
+    # log10 can round up to an integer when abs_max is just below 8*10^x
+    if 8 * 10.0**x > abs_max:
+        x -= 1
+    # limit to x >= -3 (max shift/decimal places of 9)
+    # lower abs_max -> lower x (higher shift), limit prevents encoded values from overflowing
+    x = max(x, -3)
+    # find scale to map abs_max to 8*10^x
+    scale = (8 * 10**x) / abs_max
+    # find shift to map abs_max to 8*10^6
+    shift = 6 - x
+    # float scale -> fraction, limit scalar & divisor to 12 bits (required by .ld format)
+    # idk why but mapping to 8*10^x causes fewer fraction failures than 10^x
+    scalar, divisor = best_ratio(scale, 0x7FF)
+    if scalar > 0x7FF:
+        return None
+    return (shift, scalar, divisor)
+
 # decode packets from a byte string and organize into channels
 def parse(bytes, parameters):
     channels = {
@@ -38,7 +375,8 @@ def parse(bytes, parameters):
             'type': param['type'],
             # raw data
             'n_points': 0,         # num raw datapoints
-            'points': [],
+            't_raw': [],           # recorded timestamps (uint32)
+            'v_raw': [],           # recorded values (parameter's dtype)
             't_min': 0,            # min timestamp
             't_max': 0,            # max timestamp
             'v_min': 0,            # min value
@@ -63,43 +401,20 @@ def parse(bytes, parameters):
 
     print('decoding packets... ', end='', flush=True)
     start = time.time()
-    n_errors = 0
-    # split byte string by start delimiter
-    packets = bytes.split(START.to_bytes(1, 'big'))
-    for packet in packets:
-        # unescape packet
-        pkt = bytearray()
-        esc = False
-        for b in packet:
-            if b == ESC:
-                esc = True
-            elif esc:
-                pkt.append(b ^ ESC_XOR)
-                esc = False
-            else:
-                pkt.append(b)
-        # unpack components
-        try:
-            ts, id = struct.unpack('>IH', pkt[0:6])
-            value = struct.unpack(parameters[id]['format'], pkt[6:-1])[0]
-        except:
-            n_errors += 1
-            continue
-        # validate checksum
-        sum = START
-        for b in pkt[:-1]: sum += b
-        if sum.to_bytes(2, 'big')[-1] != pkt[-1]:
-            n_errors += 1
-            continue
-        # at this point, packet is valid, add to channel
-        channels[id]['points'].append((ts, value))
+    points, n_errors = decode_packets(bytes, parameters)
+    n_packets = n_errors
+    for (id, (ts, values)) in points.items():
+        channels[id]['t_raw'] = ts
+        # keep the parameter's dtype, just swap to native byte order
+        channels[id]['v_raw'] = values.astype(values.dtype.newbyteorder('='))
+        n_packets += len(ts)
     elapsed = round(time.time() - start, 2)
     print(f'({elapsed}s)')
-    print(f'{len(packets)} packets, {n_errors} errors')
+    print(f'{n_packets} packets, {n_errors} errors')
 
     # remove channels with no data
     for id in list(channels.keys()):
-        channels[id]['n_points'] = len(channels[id]['points'])
+        channels[id]['n_points'] = len(channels[id]['t_raw'])
         if channels[id]['n_points'] == 0:
             print(f"removing empty channel: {channels[id]['name']} ({id})")
             del channels[id]
@@ -108,15 +423,18 @@ def parse(bytes, parameters):
     start = time.time()
     for ch in channels.values():
         # sort points by timestamp
-        ch['points'].sort(key=lambda pt: pt[0])
-        ch['points'] = np.array(ch['points'], dtype=np.float64)
-        # timestamps = ch['points'][:,0]
-        # values     = ch['points'][:,1]
-
-        ch['t_min'] = ch['points'][0,0]
-        ch['t_max'] = ch['points'][-1,0]
-        ch['v_min'] = ch['points'][:,1].min()
-        ch['v_max'] = ch['points'][:,1].max()
+        # points are usually logged in order, so only reorder when a timestamp goes backwards
+        # stable sort is timsort for uint32 keys, which is fast on nearly sorted runs
+        if np.any(ch['t_raw'][1:] < ch['t_raw'][:-1]):
+            order = np.argsort(ch['t_raw'], kind='stable')
+            ch['t_raw'] = ch['t_raw'][order]
+            ch['v_raw'] = ch['v_raw'][order]
+
+        ch['t_min'] = ch['t_raw'][0].item()
+        ch['t_max'] = ch['t_raw'][-1].item()
+        # convert to Python numbers so abs() can't overflow small integer types
+        ch['v_min'] = ch['v_raw'].min().item()
+        ch['v_max'] = ch['v_raw'].max().item()
     elapsed = round(time.time() - start, 2)
     print(f'({elapsed}s)')
 
@@ -130,17 +448,16 @@ def parse(bytes, parameters):
         # multiple datapoints: calculate an appropriate frequency
         else:
             # get time delta between points
-            deltas = np.diff(ch['points'][:,0])
-            # remove deltas above 100ms (minimum frequency = 10Hz)
-            deltas = deltas[deltas <= 100]
-            # or below 1ms (maximum frequency = 1000Hz)
-            deltas = deltas[deltas >= 1]
-            if len(deltas) == 0:
+            deltas = np.diff(ch['t_raw'])
+            # count deltas up to 100ms (minimum frequency = 10Hz)
+            counts = np.bincount(deltas[deltas <= 100], minlength=101)
+            # ignore deltas below 1ms (maximum frequency = 1000Hz)
+            counts[0] = 0
+            if counts.max() == 0:
                 delta = 100
             else:
-                # find the most common delta
-                unique_deltas, counts = np.unique(deltas, return_counts=True)
-                delta = int(unique_deltas[counts == counts.max()].min())
+                # find the most common delta, argmax picks the smallest on a tie
+                delta = int(counts.argmax())
             # round so that frequency is an integer
             while 1000 % delta != 0: delta += 1
             ch['delta_ms'] = delta
@@ -152,23 +469,23 @@ def parse(bytes, parameters):
 
     print('fitting to time axis... ', end='', flush=True)
     start = time.time()
+    # channels with the same time delta share one time axis, sized for the longest channel
+    groups = defaultdict(list)
     for ch in channels.values():
-        # create a new time axis with this channel's time delta and sample count
-        t_int = list(range(0, ch['sample_count'] * ch['delta_ms'], ch['delta_ms']))
-
-        # for each tick in the new time axis, use the closest recorded datapoint
-        # "closest" means the last point with a timestamp less than the tick
-        # this produces a curve that sometimes slightly lags the recorded data
-        v_int = []
-        i = 0
-        for t in t_int:
-            # skip forward to a point with timestamp ~t
-            while i+1 < ch['n_points'] and t > ch['points'][i+1][0]:
-                i += 1
-            v_int.append(ch['points'][i][1])
-
-        ch['t_int'] = np.array(t_int, dtype=np.float64)
-        ch['v_int'] = np.array(v_int, dtype=np.float64)
+        groups[ch['delta_ms']].append(ch)
+    for (delta, group) in groups.items():
+        n = max(ch['sample_count'] for ch in group)
+        t_axis = np.arange(0, n * delta, delta, dtype=np.uint32)
+        t_axis_float = t_axis.astype(np.float64)
+        for ch in group:
+            # for each tick in the new time axis, use the closest recorded datapoint
+            # "closest" means the last point with a timestamp less than the tick
+            # this produces a curve that sometimes slightly lags the recorded data
+            t = t_axis[:ch['sample_count']]
+            i = np.searchsorted(ch['t_raw'], t, side='left') - 1
+            np.maximum(i, 0, out=i)
+            ch['t_int'] = t_axis_float[:ch['sample_count']]
+            ch['v_int'] = ch['v_raw'][i].astype(np.float64)
     elapsed = round(time.time() - start, 2)
     print(f'({elapsed}s)')
 
@@ -178,36 +495,17 @@ def parse(bytes, parameters):
         ch = channels[id]
         abs_max = max(abs(ch['v_min']), abs(ch['v_max']))
 
-        # find shift, scalar, and divisor to fit value in a s32
-        # encoded_value = value / 10^-shift / scalar * divisor
-        if abs_max == 0:
-            ch['shift'], ch['scalar'], ch['divisor'] = (9, 1, 1)
-        else:
-            # find the closest value of 8*10^x to abs_max
-            x = math.floor(math.log10(abs_max / 8))
-            # limit to x >= -3 (max shift/decimal places of 9)
-            # lower abs_max -> lower x (higher shift), limit prevents encoded values from overflowing
-            x = max(x, -3)
-            # find scale to map abs_max to 8*10^x
-            scale = (8 * 10**x) / abs_max
-            # find shift to map abs_max to 8*10^6
-            shift = 6 - x
-            # float scale -> fraction, limit scalar & divisor to 12 bits (required by .ld format)
-            # idk why but mapping to 8*10^x causes fewer fraction failures than 10^x
-            scalar, divisor = Fraction(scale).limit_denominator(0x7FF).as_integer_ratio()
-            if scalar > 0x7FF:
-                # encoding failed, remove channel
-                print(f"WARNING: failed to encode channel: {ch['name']} ({id}) abs_max={abs_max}")
-                del channels[id]
-                continue
-            
-            ch['shift'], ch['scalar'], ch['divisor'] = (shift, scalar, divisor)
+        scalars = get_scalars(abs_max)
+        if scalars is None:
+            # encoding failed, remove channel
+            print(f"WARNING: failed to encode channel: {ch['name']} ({id}) abs_max={abs_max}")
+            del channels[id]
+            continue
+        ch['shift'], ch['scalar'], ch['divisor'] = scalars
 
         # encode values
-        ch['v_enc'] = np.array(
-            [v / 10**-ch['shift'] / ch['scalar'] * ch['divisor'] for v in ch['v_int']],
-            dtype=np.int32
-        )
+        k = 10.0**ch['shift'] * ch['divisor'] / ch['scalar']
+        ch['v_enc'] = np.rint(ch['v_int'] * k).astype(np.int32)
     elapsed = round(time.time() - start, 2)
     print(f'({elapsed}s)')
 
@@ -221,10 +519,10 @@ def plot(ch):
     plt.xlabel('time (ms)')
     plt.ylabel(ch['unit'])
 
-    plt.plot(ch['points'][:,0], ch['points'][:,1], '.', label='raw')
+    plt.plot(ch['t_raw'], ch['v_raw'], '.', label='raw')
     plt.plot(ch['t_int'], ch['v_int'], '-', label='interpolated')
 
-    decoded = [v * 10**-ch['shift'] * ch['scalar'] / ch['divisor'] for v in ch['v_enc']]
+    decoded = ch['v_enc'] * (10.0**-ch['shift'] * ch['scalar'] / ch['divisor'])
     plt.plot(ch['t_int'], decoded, '--', label='decoded')
 
     plt.ticklabel_format(useOffset=False)
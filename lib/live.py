@@ -4,9 +4,15 @@ import serial
 import time
 import struct
 
+from lib import gdat
+
 START = 0x7E
 ESC = 0x7D
 ESC_XOR = 0x20
+START_BYTE = bytes((START,))
+
+# packet header (TIMESTAMP, ID)
+_HDR = struct.Struct('>IH')
 
 BAUD = 230400
 BLOCK_SIZE = 1000 # bytes to read in each update
@@ -96,29 +102,17 @@ class Node:
                 continue
 
             # split block into packets and update channels
-            packets = block.split(START.to_bytes(1, 'big'))
+            packets = block.split(START_BYTE)
             for packet in packets:
-                # unescape packet
-                pkt = bytearray()
-                esc = False
-                for b in packet:
-                    if b == ESC:
-                        esc = True
-                    elif esc:
-                        pkt.append(b ^ ESC_XOR)
-                        esc = False
-                    else:
-                        pkt.append(b)
+                pkt = gdat.unescape(packet)
                 # unpack components
                 try:
-                    timestamp, id = struct.unpack('>IH', pkt[0:6])
-                    value = struct.unpack(self.parameters[id]['format'], pkt[6:-1])[0]
+                    timestamp, id = _HDR.unpack_from(pkt)
+                    value = self.parameters[id]['struct'].unpack(pkt[6:-1])[0]
                 except:
                     continue
                 # validate checksum
-                sum = START
-                for b in pkt[:-1]: sum += b
-                if sum.to_bytes(2, 'big')[-1] != pkt[-1]:
+                if not gdat.checksum(pkt):
                     continue
                 # update latest value
                 self.values[id] = value
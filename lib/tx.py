@@ -3,8 +3,8 @@ import serial
 import struct
 from pathlib import Path
 import time
-import random
 import socket
+import numpy as np
 
 sys.path.append('../')
 import gcan
@@ -26,6 +26,15 @@ START = 0x7E
 ESC = 0x7D
 ESC_XOR = 0x20
 
+# byte strings for building and escaping packets
+START_BYTE = bytes((START,))
+ESC_BYTE = bytes((ESC,))
+ESCAPED_START = bytes((ESC, START ^ ESC_XOR))
+ESCAPED_ESC = bytes((ESC, ESC ^ ESC_XOR))
+
+# packet header (TIMESTAMP, ID)
+_HDR = struct.Struct('>IH')
+
 PORT = sys.argv[1]
 BAUD = 230400
 
@@ -60,44 +69,51 @@ parameters = gcan.get_params(config)
 pids = list(parameters.keys())
 start = time.time()
 
-# generate a gdat packet with random data for the specified parameter ID
-def generate_packet():
-    id = int(random.choice(pids))
+# random data ranges for each parameter, indexed the same as pids
+rng = np.random.default_rng()
+pid_array = np.array(pids)
+is_float = np.array([parameters[id]['type'] == 'FLOATING' for id in pids])
+int_min = np.zeros(len(pids), dtype=np.int64)
+int_max = np.zeros(len(pids), dtype=np.int64)
+for (i, id) in enumerate(pids):
+    if parameters[id]['signed']:
+        int_min[i] = -(2 ^ ((parameters[id]['size'] * 8) - 1))
+        int_max[i] = 2 ^ ((parameters[id]['size'] * 8) - 1) - 1
+    else:
+        int_min[i] = 0
+        int_max[i] = 2 ^ (parameters[id]['size'] * 8) - 1
+
+# generate n gdat packets with random data for random parameter IDs
+# random ids and values are drawn for the whole batch at once, then packed in a single loop
+def generate_packets(n):
     timestamp = int((time.time() - start) * 1000)
+    k = rng.integers(0, len(pids), n)
+    ids = pid_array[k].tolist()
+    floats = rng.uniform(-100, 100, n).tolist()
+    ints = rng.integers(int_min[k], int_max[k], endpoint=True).tolist()
+    use_float = is_float[k].tolist()
 
-    if parameters[id]['type'] == 'FLOATING':
-        data = random.uniform(-100, 100)
-    else:
-        if parameters[id]['signed']:
-            min = -(2 ^ ((parameters[id]['size'] * 8) - 1))
-            max = 2 ^ ((parameters[id]['size'] * 8) - 1) - 1
-        else:
-            min = 0
-            max = 2 ^ (parameters[id]['size'] * 8) - 1
-        data = random.randint(min, max)
-
-    packet = START.to_bytes(1, 'big') + struct.pack('>I', timestamp) + struct.pack('>H', id) + struct.pack(parameters[id]['format'], data)
-    checksum = 0
-    for b in packet:
-        checksum += b
-    packet += (checksum).to_bytes(2, 'big')[-1:]
-    return packet
+    packets = []
+    for (i, id) in enumerate(ids):
+        data = floats[i] if use_float[i] else ints[i]
+        packet = START_BYTE + _HDR.pack(timestamp, id) + parameters[id]['struct'].pack(data)
+        packet += bytes((sum(packet) & 0xFF,))
+        packets.append(packet)
+    return packets
+
+# escape control bytes in a packet (excluding the leading START)
+# replace ESC first, otherwise the ESC added in front of each START would be escaped again
+def escape(packet):
+    return START_BYTE + packet[1:].replace(ESC_BYTE, ESCAPED_ESC).replace(START_BYTE, ESCAPED_START)
 
 print(f'transmitting on port "{PORT}"...')
 while True:
     bytes_written = 0
-    while bytes_written < BLOCK_SIZE:
-        packet = generate_packet()
-        pkt = START.to_bytes(1, 'big')
-        # escape packet
-        for b in packet[1:]:
-            if b == ESC or b == START:
-                # add 7D control byte with escaped byte
-                pkt += ESC.to_bytes(1, 'big')
-                pkt += (b ^ 0x20).to_bytes(1, 'big')
-            else:
-                # add raw byte
-                pkt += (b).to_bytes(1, 'big')
+    # every packet is at least 9 bytes, so this is always enough to fill a block
+    for packet in generate_packets(BLOCK_SIZE // 9 + 1):
+        if bytes_written >= BLOCK_SIZE:
+            break
+        pkt = escape(packet)
         # transmit packet
         if PORT_TYPE == 'serial':
             n = port.write(pkt)
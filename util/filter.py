@@ -12,6 +12,13 @@ import time
 START = 0x7E
 ESC = 0x7D
 ESC_XOR = 0x20
+START_BYTE = bytes((START,))
+
+# packet header (TIMESTAMP, ID)
+_HDR = struct.Struct('>IH')
+
+# max unescaped packet length, excluding the start delimiter
+MAX_PACKET_LENGTH = 15
 
 ipath = Path(sys.argv[1])
 opath = Path(sys.argv[2])
@@ -42,37 +49,45 @@ ofile = open(opath, 'wb')
 ofile.write(bytes(sof + ext))
 
 # filter packets
-packets = data.split(START.to_bytes())
+packets = data.split(START_BYTE)
+# packets are unescaped into a single reusable buffer
+scratch = bytearray(MAX_PACKET_LENGTH)
+scratch_view = memoryview(scratch)
 n_errors = 0
 n_copied = 0
 for packet in packets:
-    # unescape packet
-    pkt = bytearray()
+    # unescape packet into the scratch buffer
+    pkt_len = 0
     esc = False
     for b in packet:
         if b == ESC:
             esc = True
-        elif esc:
-            pkt.append(b ^ ESC_XOR)
+            continue
+        if esc:
+            b ^= ESC_XOR
             esc = False
-        else:
-            pkt.append(b)
+        # bytes past MAX_PACKET_LENGTH are counted but not stored
+        if pkt_len < MAX_PACKET_LENGTH:
+            scratch[pkt_len] = b
+        pkt_len += 1
+    if pkt_len > MAX_PACKET_LENGTH:
+        n_errors += 1
+        continue
+    pkt = scratch_view[:pkt_len]
     # unpack components
     try:
-        ts, id = struct.unpack('>IH', pkt[0:6])
+        ts, id = _HDR.unpack_from(pkt)
     except:
         n_errors += 1
         continue
     # validate checksum
-    sum = START
-    for b in pkt[:-1]: sum += b
-    if sum.to_bytes(2)[-1] != pkt[-1]:
+    if (sum(pkt, START) - pkt[-1]) & 0xFF != pkt[-1]:
         n_errors += 1
         continue
     # check if id is whitelisted
     if id in filter_ids:
         # copy to output file
-        ofile.write(START.to_bytes() + packet)
+        ofile.write(START_BYTE + packet)
         n_copied += 1
 
 print(f'{len(packets)} packets, {n_errors} errors, {n_copied} copied')
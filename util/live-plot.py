@@ -28,6 +28,12 @@ START = 0x7E
 ESC = 0x7D
 ESC_XOR = 0x20
 
+# packet header (TIMESTAMP, ID)
+_HDR = struct.Struct('>IH')
+
+# max unescaped packet length, excluding the start delimiter
+MAX_PACKET_LENGTH = 15
+
 PORT = sys.argv[1]
 BAUD = 230400
 
@@ -72,6 +78,9 @@ channels = {
 }
 
 def rx():
+    # packets are unescaped into a single reusable buffer
+    scratch = bytearray(MAX_PACKET_LENGTH)
+    scratch_view = memoryview(scratch)
     print(f'listening on port "{PORT}"...')
     while True:
         if PORT_TYPE == 'serial':
@@ -81,28 +90,33 @@ def rx():
 
         packets = bytes.split(START.to_bytes(1, 'big'))
         for packet in packets:
-            # unescape packet
-            pkt = bytearray()
+            # unescape packet into the scratch buffer
+            pkt_len = 0
             esc = False
             for b in packet:
                 if b == ESC:
                     esc = True
-                elif esc:
-                    pkt.append(b ^ ESC_XOR)
+                    continue
+                if esc:
+                    b ^= ESC_XOR
                     esc = False
-                else:
-                    pkt.append(b)
+                # bytes past MAX_PACKET_LENGTH are counted but not stored
+                if pkt_len < MAX_PACKET_LENGTH:
+                    scratch[pkt_len] = b
+                pkt_len += 1
+            if pkt_len > MAX_PACKET_LENGTH:
+                # print(f'packet too long: {packet}')
+                continue
+            pkt = scratch_view[:pkt_len]
             # unpack components
             try:
-                ts, id = struct.unpack('>IH', pkt[0:6])
-                value = struct.unpack(parameters[id]['format'], pkt[6:-1])[0]
+                ts, id = _HDR.unpack_from(pkt)
+                value = parameters[id]['struct'].unpack(pkt[6:-1])[0]
             except:
                 # print(f'failed to decode: {packet}')
                 continue
             # validate checksum
-            sum = START
-            for b in pkt[:-1]: sum += b
-            if sum.to_bytes(2, 'big')[-1] != pkt[-1]:
+            if (sum(pkt, START) - pkt[-1]) & 0xFF != pkt[-1]:
                 # print(f'invalid checksum: {packet}')
                 continue
             # add datapoint to channel